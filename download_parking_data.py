@@ -8,13 +8,26 @@ and combines them into a single CSV file for analysis.
 Dataset URL: https://openregina.ca/dataset/parking-services-tickets-issued-report-2025-to-2028
 """
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import requests
+from python_calamine import CalamineWorkbook
+from requests.adapters import HTTPAdapter
+import json
 import os
+import re
+import threading
 from pathlib import Path
 import logging
 from typing import List, Optional
 import time
+from datetime import date, timedelta
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(
@@ -22,12 +35,191 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 2025 Saskatchewan public holidays
+HOLIDAYS_2025 = pd.DatetimeIndex(
+    [
+        "2025-01-01",  # New Year's Day
+        "2025-02-17",  # Family Day
+        "2025-04-18",  # Good Friday
+        "2025-05-19",  # Victoria Day
+        "2025-07-01",  # Canada Day
+        "2025-08-04",  # Saskatchewan Day
+        "2025-09-01",  # Labour Day
+        "2025-10-13",  # Thanksgiving
+        "2025-11-11",  # Remembrance Day
+        "2025-12-25",  # Christmas Day
+    ]
+)
+
+# Low-cardinality label columns, stored as categoricals
+CATEGORICAL_COLUMNS = [
+    "LOCATION",
+    "DAY_OF_WEEK",
+    "WEEKEND_OR_WEEKDAY",
+    "TIME_CATEGORY",
+    "IS_PUBLIC_HOLIDAY",
+]
+
+# VIOL_LOC patterns used by split_location
+NUMBERED_LOCATION_PATTERN = re.compile(r"^(.+?)\s+(\d+\s+.+)$", re.IGNORECASE)
+LOCATION_PREFIX_PATTERN = re.compile(
+    r"^(WEST SIDE|EAST SIDE|NORTH SIDE|SOUTH SIDE|IN FRONT OF|OPPOSITE|BESIDE|BEHIND|NEAR|ADJACENT TO)\s+(.+)$",
+    re.IGNORECASE,
+)
+STARTS_WITH_DIGIT_PATTERN = re.compile(r"^\d")
+
+# Cell strings pd.read_excel treats as missing by default (its na_values)
+NA_VALUES = frozenset(
+    [
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    ]
+)
+
+
+def read_xls_file(file_path: Path) -> Optional[pd.DataFrame]:
+    """Read XLS/XLSX file and return DataFrame."""
+    rows = read_xls_rows(file_path)
+    if rows is None:
+        return None
+    if not rows:
+        return pd.DataFrame()
+    return rows_to_dataframe(rows[0], rows[1:])
+
+
+def read_xls_rows(file_path: Path) -> Optional[List[list]]:
+    """Read the first worksheet of an XLS/XLSX file as rows, header first.
+
+    Cells are converted the way pandas' Excel readers convert them.
+    """
+    try:
+        logger.info(f"Reading {file_path.name}...")
+        if file_path.suffix.lower() == ".xlsx":
+            rows = read_xlsx_rows(file_path)
+        else:
+            workbook = CalamineWorkbook.from_path(str(file_path))
+            rows = workbook.get_sheet_by_index(0).to_python(skip_empty_area=False)
+        if rows:
+            # The header keeps its text as is; only data cells use NA_VALUES
+            header = [convert_cell(value, na_values=()) for value in rows[0]]
+            data = [[convert_cell(value) for value in row] for row in rows[1:]]
+            rows = [header] + data
+        logger.info(f"Read {max(len(rows) - 1, 0)} rows from {file_path.name}")
+        return rows
+    except Exception as e:
+        logger.error(f"Error reading {file_path}: {e}")
+        return None
+
+
+def read_xlsx_rows(file_path: Path) -> List[list]:
+    """Read XLSX rows with openpyxl in read-only mode, skipping cell objects.
+
+    Like pd.read_excel, the sheet dimensions are recomputed rather than
+    trusted, and trailing empty cells and rows are trimmed.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        ws.reset_dimensions()
+
+        rows = []
+        last_row_with_data = -1
+        for row_number, row in enumerate(ws.iter_rows(values_only=True)):
+            row = list(row)
+            while row and row[-1] in (None, ""):
+                row.pop()
+            if row:
+                last_row_with_data = row_number
+            rows.append(row)
+        rows = rows[: last_row_with_data + 1]
+
+        # Pad rows back to a common width
+        width = max((len(row) for row in rows), default=0)
+        return [row + [None] * (width - len(row)) for row in rows]
+    finally:
+        wb.close()
+
+
+def convert_cell(value, na_values=NA_VALUES):
+    """Convert a worksheet cell the way pd.read_excel does."""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        # Empty cells come back as "", which read_excel treats as missing
+        return np.nan if value in na_values else value
+    if isinstance(value, float):
+        # Integers are stored as floats in Excel
+        return int(value) if value.is_integer() else value
+    if isinstance(value, date):
+        return pd.Timestamp(value)
+    if isinstance(value, timedelta):
+        return pd.Timedelta(value)
+    return value
+
+
+def deduplicate_header(header) -> List:
+    """Name blank columns "Unnamed: N" and suffix duplicates ".1", ".2", ...
+
+    Mirrors the column naming of pd.read_excel: named columns are
+    de-duplicated before unnamed ones, skipping names already in the header.
+    """
+    names = []
+    unnamed = []
+    for i, name in enumerate(header):
+        if pd.isna(name) or name == "":
+            names.append(f"Unnamed: {i}")
+            unnamed.append(i)
+        else:
+            names.append(name)
+
+    counts = {}
+    named = [i for i in range(len(names)) if i not in unnamed]
+    for i in named + unnamed:
+        name = original = names[i]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def rows_to_dataframe(header, rows: List[list]) -> pd.DataFrame:
+    """Build a DataFrame from converted worksheet rows."""
+    return pd.DataFrame(rows, columns=deduplicate_header(header))
+
 
 class ReginaParkingDataDownloader:
-    def __init__(self, output_dir: str = "data"):
-        """Initialize the downloader with output directory."""
+    def __init__(self, output_dir: str = "data", save_csv: bool = True):
+        """Initialize the downloader with output directory.
+
+        The combined data is always saved as Parquet; ``save_csv`` also writes
+        the CSV copy that the Power BI report reads.
+        """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.save_csv = save_csv
 
         # Direct download URLs for XLS files (these would need to be updated with actual URLs)
         self.xls_urls = {
@@ -39,21 +231,38 @@ class ReginaParkingDataDownloader:
         self.ckan_base_url = "https://openregina.ca/api/3/action"
         self.dataset_id = "parking-services-tickets-issued-report-2025-to-2028"
 
+        # Shared HTTP session so concurrent downloads reuse pooled connections
+        self.max_download_workers = 8
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_download_workers,
+            pool_maxsize=self.max_download_workers,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # ETag/Last-Modified of previous downloads, used for conditional GETs
+        self.cache_file = self.output_dir / ".cache.json"
+        self.download_cache = self.load_download_cache()
+        self.cache_lock = threading.Lock()
+
     def get_dataset_resources(self) -> List[dict]:
         """Get dataset resources using CKAN API to find XLS files."""
         try:
             url = f"{self.ckan_base_url}/package_show"
             params = {"id": self.dataset_id}
 
-            response = requests.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             if data.get("success"):
                 resources = data["result"]["resources"]
-                # Filter for XLS files
+                # Filter for XLS/XLSX files
                 xls_resources = [
-                    r for r in resources if r.get("format", "").upper() == "XLS"
+                    r
+                    for r in resources
+                    if r.get("format", "").upper() in ("XLS", "XLSX")
                 ]
                 logger.info(f"Found {len(xls_resources)} XLS resources")
                 return xls_resources
@@ -65,34 +274,97 @@ class ReginaParkingDataDownloader:
             logger.error(f"Error fetching dataset resources: {e}")
             return []
 
-    def download_file(self, url: str, filename: str) -> bool:
-        """Download a file from URL to local directory."""
+    def load_download_cache(self) -> dict:
+        """Load cached download headers from the output directory."""
         try:
-            logger.info(f"Downloading {filename}...")
-            response = requests.get(url, timeout=60)
-            response.raise_for_status()
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable download cache: {e}")
+            return {}
+
+    def update_download_cache(self, filename: str, headers) -> None:
+        """Remember the ETag/Last-Modified headers for a downloaded file."""
+        entry = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        with self.cache_lock:
+            self.download_cache[filename] = entry
+            with open(self.cache_file, "w") as f:
+                json.dump(self.download_cache, f, indent=2)
 
-            file_path = self.output_dir / filename
-            with open(file_path, "wb") as f:
-                f.write(response.content)
+    def download_file(self, url: str, filename: str) -> bool:
+        """Download a file from URL to local directory, skipping it if unchanged."""
+        file_path = self.output_dir / filename
+        # Write to a temporary file so a failed download never leaves a
+        # partial file behind that a later 304 would treat as current
+        part_path = file_path.with_name(f"{filename}.part")
+        try:
+            # Ask the server to skip the body if our local copy is current
+            headers = {}
+            cached = self.download_cache.get(filename, {})
+            if file_path.exists():
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
 
-            logger.info(f"Downloaded {filename} ({len(response.content)} bytes)")
+            logger.info(f"Downloading {filename}...")
+            with self.session.get(
+                url, headers=headers, stream=True, timeout=60
+            ) as response:
+                if response.status_code == 304:
+                    logger.info(f"{filename} is up to date, skipping download")
+                    return True
+                response.raise_for_status()
+
+                with open(part_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+                part_path.replace(file_path)
+
+            self.update_download_cache(filename, response.headers)
+            logger.info(f"Downloaded {filename} ({file_path.stat().st_size} bytes)")
             return True
 
         except Exception as e:
             logger.error(f"Error downloading {filename}: {e}")
+            part_path.unlink(missing_ok=True)
             return False
 
     def read_xls_file(self, file_path: Path) -> Optional[pd.DataFrame]:
-        """Read XLS file and return DataFrame."""
-        try:
-            logger.info(f"Reading {file_path.name}...")
-            df = pd.read_excel(file_path, engine="xlrd")
-            logger.info(f"Read {len(df)} rows from {file_path.name}")
-            return df
-        except Exception as e:
-            logger.error(f"Error reading {file_path}: {e}")
-            return None
+        """Read XLS/XLSX file and return DataFrame."""
+        return read_xls_file(file_path)
+
+    def read_xls_files(self, file_paths: List[Path]) -> List[pd.DataFrame]:
+        """Read several XLS/XLSX files in parallel, one process per file.
+
+        Rows from consecutive files that share a header are gathered into a
+        single DataFrame, so there is usually one frame and nothing to
+        concatenate. Frames stay in file order.
+        """
+        # A pool only pays off with more than one worker; otherwise it just
+        # adds process start-up and pickling of every row
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        if max_workers <= 1:
+            results = [read_xls_rows(file_path) for file_path in file_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(read_xls_rows, file_paths))
+
+        groups = []
+        for rows in results:
+            if not rows:
+                continue
+            if groups and groups[-1][0] == rows[0]:
+                groups[-1][1].extend(islice(rows, 1, None))
+            else:
+                groups.append((rows[0], rows[1:]))
+
+        return [rows_to_dataframe(header, rows) for header, rows in groups]
 
     def combine_dataframes(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
         """Combine multiple DataFrames into one."""
@@ -101,7 +373,10 @@ class ReginaParkingDataDownloader:
             return pd.DataFrame()
 
         logger.info(f"Combining {len(dataframes)} dataframes...")
-        combined_df = pd.concat(dataframes, ignore_index=True)
+        if len(dataframes) == 1:
+            combined_df = dataframes[0].reset_index(drop=True)
+        else:
+            combined_df = pd.concat(dataframes, ignore_index=True, sort=False)
         logger.info(f"Combined dataframe has {len(combined_df)} rows")
 
         # Process the combined dataframe
@@ -111,23 +386,49 @@ class ReginaParkingDataDownloader:
 
     def process_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Process the dataframe: convert datetime and split location."""
+        # Already processed (e.g. called twice): skip redundant work. Either
+        # branch below leaves its own marker column behind.
+        if "VIOLATION_DATE" in df.columns or (
+            "LOCATION" in df.columns and "ADDRESS" in df.columns
+        ):
+            logger.info("Dataframe already processed, skipping")
+            return df
+
         logger.info("Processing dataframe...")
 
         # Convert VIOLATION_DATETIME to proper datetime format
         if "VIOLATION_DATETIME" in df.columns:
             logger.info("Converting VIOLATION_DATETIME to datetime format...")
-            df["VIOLATION_DATETIME"] = pd.to_datetime(
-                df["VIOLATION_DATETIME"], format="%d/%m/%Y %H:%M:%S", errors="coerce"
+            # Tickets share timestamps, so parse each distinct value only once
+            codes, uniques = pd.factorize(df["VIOLATION_DATETIME"])
+            parsed = pd.to_datetime(
+                uniques, format="%d/%m/%Y %H:%M:%S", errors="coerce"
+            )
+            df["VIOLATION_DATETIME"] = pd.Series(
+                parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=df.index
             )
 
             # Split datetime into separate date and time columns
             logger.info("Splitting datetime into VIOLATION_DATE and VIOLATION_TIME...")
-            df["VIOLATION_DATE"] = df["VIOLATION_DATETIME"].dt.date
-            df["VIOLATION_TIME"] = df["VIOLATION_DATETIME"].dt.time
+            # Keep both typed (datetime64/timedelta64); they are formatted on write
+            df["VIOLATION_DATE"] = df["VIOLATION_DATETIME"].dt.normalize()
+            df["VIOLATION_TIME"] = df["VIOLATION_DATETIME"] - df["VIOLATION_DATE"]
 
             # Add time category
             logger.info("Adding TIME_CATEGORY column...")
-            df["TIME_CATEGORY"] = df["VIOLATION_DATETIME"].apply(self.categorize_time)
+            hour = df["VIOLATION_DATETIME"].dt.hour
+            df["TIME_CATEGORY"] = pd.Series(
+                np.select(
+                    [
+                        (hour >= 8) & (hour < 12),
+                        (hour >= 12) & (hour < 17),
+                        (hour >= 17) & (hour < 23),
+                    ],
+                    ["8am-12pm", "12pm-5pm", "5pm-11pm"],
+                    default="11pm-8am",  # 23-8 (11pm to 8am)
+                ),
+                index=df.index,
+            ).where(hour.notna())
 
             # Add day of week
             logger.info("Adding DAY_OF_WEEK column...")
@@ -135,13 +436,17 @@ class ReginaParkingDataDownloader:
 
             # Add weekend/weekday indicator
             logger.info("Adding WEEKEND_OR_WEEKDAY column...")
-            df["WEEKEND_OR_WEEKDAY"] = df["VIOLATION_DATETIME"].dt.dayofweek.apply(
-                lambda x: "Weekend" if x >= 5 else "Weekday"
-            )
+            day_of_week = df["VIOLATION_DATETIME"].dt.dayofweek
+            df["WEEKEND_OR_WEEKDAY"] = pd.Series(
+                np.where(day_of_week >= 5, "Weekend", "Weekday"), index=df.index
+            ).where(day_of_week.notna())
 
             # Add public holiday indicator
             logger.info("Adding IS_PUBLIC_HOLIDAY column...")
-            df["IS_PUBLIC_HOLIDAY"] = df["VIOLATION_DATE"].apply(self.is_public_holiday)
+            is_holiday = df["VIOLATION_DATE"].isin(HOLIDAYS_2025)
+            df["IS_PUBLIC_HOLIDAY"] = pd.Series(
+                np.where(is_holiday, "Yes", "No"), index=df.index
+            ).where(df["VIOLATION_DATETIME"].notna())
 
         # Split VIOL_LOC into LOCATION and ADDRESS
         if "VIOL_LOC" in df.columns:
@@ -151,123 +456,66 @@ class ReginaParkingDataDownloader:
         # Clean up known typos and data issues
         df = self.clean_data(df)
 
+        for column in CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+
         logger.info("Processing complete")
         return df
 
-    def categorize_time(self, dt):
-        """Categorize time into periods."""
-        if pd.isna(dt):
-            return None
-
-        hour = dt.hour
-
-        if 8 <= hour < 12:
-            return "8am-12pm"
-        elif 12 <= hour < 17:
-            return "12pm-5pm"
-        elif 17 <= hour < 23:
-            return "5pm-11pm"
-        else:  # 23-8 (11pm to 8am)
-            return "11pm-8am"
-
-    def is_public_holiday(self, date_val):
-        """Check if a date is a public holiday in Saskatchewan for 2025."""
-        if pd.isna(date_val):
-            return None
-
-        # Convert to datetime.date if it's not already
-        if hasattr(date_val, "date"):
-            date_val = date_val.date()
-
-        # 2025 Saskatchewan public holidays
-        holidays_2025 = [
-            pd.Timestamp("2025-01-01").date(),  # New Year's Day
-            pd.Timestamp("2025-02-17").date(),  # Family Day
-            pd.Timestamp("2025-04-18").date(),  # Good Friday
-            pd.Timestamp("2025-05-19").date(),  # Victoria Day
-            pd.Timestamp("2025-07-01").date(),  # Canada Day
-            pd.Timestamp("2025-08-04").date(),  # Saskatchewan Day
-            pd.Timestamp("2025-09-01").date(),  # Labour Day
-            pd.Timestamp("2025-10-13").date(),  # Thanksgiving
-            pd.Timestamp("2025-11-11").date(),  # Remembrance Day
-            pd.Timestamp("2025-12-25").date(),  # Christmas Day
-        ]
-
-        return "Yes" if date_val in holidays_2025 else "No"
-
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean up known typos and data quality issues."""
         logger.info("Cleaning data...")
 
         if "ADDRESS" in df.columns:
-            # Fix typo: "Augus St" should be "Angus St"
-            df["ADDRESS"] = df["ADDRESS"].str.replace(
-                "Augus St,", "Angus St,", regex=False
-            )
-            # Fix typo: "August St" should be "Angus St"
+            # Nothing to fix, skip rebuilding the column
+            if not df["ADDRESS"].str.contains("Augus", regex=False).any():
+                return df
+
+            # Fix typos: "Augus St" and "August St" should be "Angus St"
             df["ADDRESS"] = df["ADDRESS"].str.replace(
-                "August St,", "Angus St,", regex=False
+                r"August? St,", "Angus St,", regex=True
             )
 
         return df
 
     def split_location(self, df: pd.DataFrame) -> pd.DataFrame:
         """Split VIOL_LOC into LOCATION (direction) and ADDRESS (street address)."""
-        import re
-
-        def parse_location(viol_loc):
-            """Parse the VIOL_LOC string into location and address."""
-            if pd.isna(viol_loc):
-                return None, None
-
-            viol_loc_str = str(viol_loc).strip()
-
-            location = None
-            address = None
-
-            # First try: Match pattern with street number (e.g., "WEST SIDE 1800 ANGUS ST")
-            match = re.match(r"^(.+?)\s+(\d+\s+.+)$", viol_loc_str, re.IGNORECASE)
-
-            if match:
-                potential_location = match.group(1).strip()
-                potential_address = match.group(2).strip()
+        viol_loc = df["VIOL_LOC"].astype("string").str.strip()
+
+        # First try: Match pattern with street number (e.g., "WEST SIDE 1800 ANGUS ST")
+        numbered = viol_loc.str.extract(NUMBERED_LOCATION_PATTERN)
+        has_number = numbered[0].notna()
+        numbered_location = numbered[0].str.strip()
+        # If the potential location starts with a number, it's the full address
+        use_numbered = has_number & ~numbered_location.str.match(
+            STARTS_WITH_DIGIT_PATTERN
+        ).fillna(False)
+
+        # Second try: Check for common location prefixes without street numbers
+        # (e.g., "IN FRONT OF DARKE CRES" or "NORTH SIDE 11TH AVE")
+        prefixed = viol_loc[~has_number].str.extract(LOCATION_PREFIX_PATTERN)
+
+        location = numbered_location.where(use_numbered).fillna(prefixed[0].str.strip())
+        # No pattern matched, treat entire string as address
+        address = (
+            numbered[1]
+            .str.strip()
+            .where(use_numbered)
+            .fillna(prefixed[1].str.strip())
+            .fillna(viol_loc)
+        )
 
-                # Check if the potential location is NOT starting with a number
-                if not re.match(r"^\d", potential_location):
-                    location = potential_location
-                    address = potential_address
-                else:
-                    # If starts with number, it's the full address
-                    address = viol_loc_str
-            else:
-                # Second try: Check for common location prefixes without street numbers
-                # (e.g., "IN FRONT OF DARKE CRES" or "NORTH SIDE 11TH AVE")
-                prefix_pattern = r"^(WEST SIDE|EAST SIDE|NORTH SIDE|SOUTH SIDE|IN FRONT OF|OPPOSITE|BESIDE|BEHIND|NEAR|ADJACENT TO)\s+(.+)$"
-                prefix_match = re.match(prefix_pattern, viol_loc_str, re.IGNORECASE)
-
-                if prefix_match:
-                    location = prefix_match.group(1).strip()
-                    address = prefix_match.group(2).strip()
-                else:
-                    # No pattern matched, treat entire string as address
-                    address = viol_loc_str
-
-            # Format location with proper capitalization
-            if location:
-                location = location.title()
-
-            # Format address with proper capitalization and add Regina, Saskatchewan
-            if address:
-                # Capitalize first letter of each word
-                address = address.title()
-                # Add Regina, Saskatchewan
-                address = f"{address}, Regina, Saskatchewan"
-
-            return location, address
-
-        # Apply the parsing function
-        df[["LOCATION", "ADDRESS"]] = df["VIOL_LOC"].apply(
-            lambda x: pd.Series(parse_location(x))
+        # Format with proper capitalization and add Regina, Saskatchewan.
+        # Addresses repeat a lot, so format each distinct one only once.
+        df["LOCATION"] = location.str.title()
+        codes, uniques = pd.factorize(address)
+        uniques = pd.Series(uniques, dtype="string")
+        formatted = (uniques.str.title() + ", Regina, Saskatchewan").mask(
+            uniques == "", uniques
+        )
+        df["ADDRESS"] = pd.Series(
+            formatted.array.take(codes, allow_fill=True), index=df.index
         )
 
         return df
@@ -281,10 +529,9 @@ class ReginaParkingDataDownloader:
                 logger.error("No XLS resources found")
                 return False
 
-            downloaded_files = []
-            dataframes = []
+            downloads = []
 
-            # Download each XLS file
+            # Collect the XLS files to download
             for i, resource in enumerate(resources):
                 url = resource.get("url")
                 name = resource.get("name", f"parking_data_{i+1}")
@@ -293,19 +540,26 @@ class ReginaParkingDataDownloader:
                     logger.warning(f"No URL found for resource: {name}")
                     continue
 
-                filename = f"{name}.xls"
-                if self.download_file(url, filename):
-                    downloaded_files.append(self.output_dir / filename)
+                extension = resource.get("format", "xls").lower()
+                downloads.append((url, f"{name}.{extension}"))
+
+            # Download the files concurrently, keeping resource order
+            with ThreadPoolExecutor(max_workers=self.max_download_workers) as executor:
+                results = list(
+                    executor.map(lambda job: self.download_file(*job), downloads)
+                )
+            downloaded_files = [
+                self.output_dir / filename
+                for (_, filename), ok in zip(downloads, results)
+                if ok
+            ]
 
             if not downloaded_files:
                 logger.error("No files were downloaded successfully")
                 return False
 
             # Read and combine all XLS files
-            for file_path in downloaded_files:
-                df = self.read_xls_file(file_path)
-                if df is not None:
-                    dataframes.append(df)
+            dataframes = self.read_xls_files(downloaded_files)
 
             if not dataframes:
                 logger.error("No dataframes were read successfully")
@@ -315,10 +569,15 @@ class ReginaParkingDataDownloader:
             combined_df = self.combine_dataframes(dataframes)
 
             # Save combined data
-            output_file = self.output_dir / "combined_parking_tickets.csv"
-            combined_df.to_csv(output_file, index=False)
+            output_file = self.output_dir / "combined_parking_tickets.parquet"
+            self.write_parquet(combined_df, output_file)
             logger.info(f"Combined data saved to {output_file}")
 
+            if self.save_csv:
+                csv_file = self.output_dir / "combined_parking_tickets.csv"
+                self.write_csv(combined_df, csv_file)
+                logger.info(f"Combined data saved to {csv_file}")
+
             # Display summary
             self.display_summary(combined_df)
 
@@ -328,6 +587,46 @@ class ReginaParkingDataDownloader:
             logger.error(f"Error in download_and_combine: {e}")
             return False
 
+    def write_parquet(self, df: pd.DataFrame, output_file: Path):
+        """Write the combined dataframe to a typed, zstd-compressed Parquet file."""
+        pq.write_table(self.to_arrow_table(df), output_file, compression="zstd")
+
+    def to_arrow_table(self, df: pd.DataFrame) -> pa.Table:
+        """Convert the dataframe to an Arrow table.
+
+        Object columns can mix numbers and text (e.g. INF_CD codes "451" read
+        as numbers next to "354A"), which Arrow cannot infer a type for, so
+        they are written as strings.
+        """
+        object_columns = [
+            column for column, dtype in df.dtypes.items() if dtype == object
+        ]
+        if len(object_columns):
+            df = df.astype({column: "string" for column in object_columns})
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+    def write_csv(self, df: pd.DataFrame, output_file: Path):
+        """Write the combined dataframe to CSV with PyArrow's native writer."""
+        table = self.to_arrow_table(df)
+
+        # Cast to second-resolution Arrow types so the CSV keeps plain
+        # "YYYY-MM-DD HH:MM:SS", "YYYY-MM-DD" and "HH:MM:SS" values.
+        # Unsafe casts truncate any fractional seconds instead of raising.
+        casts = {
+            "VIOLATION_DATETIME": lambda col: col.cast(pa.timestamp("s"), safe=False),
+            "VIOLATION_DATE": lambda col: col.cast(pa.date32(), safe=False),
+            "VIOLATION_TIME": lambda col: col.cast(pa.duration("s"), safe=False)
+            .cast(pa.int64())
+            .cast(pa.int32())
+            .cast(pa.time32("s")),
+        }
+        for name, cast in casts.items():
+            if name in table.column_names:
+                index = table.column_names.index(name)
+                table = table.set_column(index, name, cast(table[name]))
+
+        pacsv.write_csv(table, str(output_file))
+
     def display_summary(self, df: pd.DataFrame):
         """Display summary statistics of the combined data."""
         print("\n" + "=" * 50)
@@ -338,9 +637,9 @@ class ReginaParkingDataDownloader:
 
         # Display date range
         if "VIOLATION_DATE" in df.columns:
-            print(
-                f"Date range: {df['VIOLATION_DATE'].min()} to {df['VIOLATION_DATE'].max()}"
-            )
+            dates = df["VIOLATION_DATE"].dropna()
+            if not dates.empty:
+                print(f"Date range: {dates.min():%Y-%m-%d} to {dates.max():%Y-%m-%d}")
 
         # Display time category statistics
         if "TIME_CATEGORY" in df.columns:
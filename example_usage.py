@@ -22,9 +22,9 @@ def main():
     if success:
         print("✅ Data successfully downloaded and combined!")
 
-        # Load the combined data for analysis
-        combined_file = downloader.output_dir / "combined_parking_tickets.csv"
-        df = pd.read_csv(combined_file)
+        # Load the combined data for analysis (dates and times keep their types)
+        combined_file = downloader.output_dir / "combined_parking_tickets.parquet"
+        df = pd.read_parquet(combined_file)
 
         print(f"\n📊 Dataset Overview:")
         print(f"Total records: {len(df):,}")
@@ -35,19 +35,22 @@ def main():
         print(df.head())
 
         # Basic statistics if date column exists
-        if "Date" in df.columns:
-            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-            print(f"\n📅 Date range: {df['Date'].min()} to {df['Date'].max()}")
+        if "VIOLATION_DATE" in df.columns:
+            dates = df["VIOLATION_DATE"].dropna()
+            if not dates.empty:
+                print(
+                    f"\n📅 Date range: {dates.min():%Y-%m-%d} to {dates.max():%Y-%m-%d}"
+                )
 
         # Top infractions if infraction column exists
-        if "Infraction" in df.columns:
+        if "INF_DESCR" in df.columns:
             print(f"\n� Top 5 infractions:")
-            print(df["Infraction"].value_counts().head())
+            print(df["INF_DESCR"].value_counts().head())
 
         # Top locations if location column exists
-        if "Location" in df.columns:
+        if "LOCATION" in df.columns:
             print(f"\n📍 Top 5 locations:")
-            print(df["Location"].value_counts().head())
+            print(df["LOCATION"].value_counts().head())
 
     else:
         print("❌ Failed to download data. Check the logs for details.")